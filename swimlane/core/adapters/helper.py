@@ -1,6 +1,7 @@
-import pendulum
+from concurrent.futures import ThreadPoolExecutor
 
 from swimlane.core.resolver import SwimlaneResolver
+from swimlane.utils import rfc3339_now
 from swimlane.utils.version import requires_swimlane_version
 from swimlane.utils.list_validator import validate_str_list
 from swimlane.utils.str_validator import validate_str
@@ -9,6 +10,9 @@ from swimlane.utils.str_validator import validate_str
 class HelperAdapter(SwimlaneResolver):
     """Adapter providing any miscellaneous API calls not better suited for another adapter"""
 
+    # Max number of requests sent concurrently by bulk helpers
+    max_request_workers = 8
+
     @requires_swimlane_version('2.15')
     def add_record_references(self, app_id, record_id, field_id, target_record_ids):
         """Bulk operation to directly add record references without making any additional requests
@@ -24,6 +28,56 @@ class HelperAdapter(SwimlaneResolver):
         """
         validate_str_list(target_record_ids, "target_record_ids")
 
+        self._post_record_references(app_id, record_id, field_id, target_record_ids)
+
+    @requires_swimlane_version('2.15')
+    def add_record_references_bulk(self, app_id, references):
+        """Directly add record references to many records, sending requests concurrently over the shared session
+
+        All references are validated before any requests are sent
+
+        Warnings:
+            Does not perform any app, record, or target app/record validation
+
+        Args:
+            app_id (str): Full App ID string
+            references (List(dict)): List of dicts with `record_id`, `field_id`, and `target_record_ids` keys, matching
+                the arguments of :meth:`add_record_references`
+
+        Raises:
+            ValueError: If any provided reference is invalid
+        """
+        validate_str(app_id, 'app_id')
+
+        if not references or not isinstance(references, list):
+            raise ValueError('references must be a non-empty list value')
+
+        for reference in references:
+            if not isinstance(reference, dict):
+                raise ValueError('references must contain dict values')
+
+            validate_str(reference.get('record_id'), 'record_id')
+            validate_str(reference.get('field_id'), 'field_id')
+            validate_str_list(reference.get('target_record_ids'), 'target_record_ids')
+
+        with ThreadPoolExecutor(max_workers=min(self.max_request_workers, len(references))) as executor:
+            futures = [
+                executor.submit(
+                    self._post_record_references,
+                    app_id,
+                    reference['record_id'],
+                    reference['field_id'],
+                    reference['target_record_ids']
+                )
+                for reference in references
+            ]
+
+        # Raise first failed request, if any
+        for future in futures:
+            future.result()
+
+    def _post_record_references(self, app_id, record_id, field_id, target_record_ids):
+        """Send add-references request for a single record"""
         self._swimlane.request(
             'post',
             'app/{0}/record/{1}/add-references'.format(app_id, record_id),
@@ -50,21 +104,18 @@ class HelperAdapter(SwimlaneResolver):
         validate_str(record_id, 'record_id')
         validate_str(field_id, 'field_id')
         validate_str(message, 'message')
-        
-        if not isinstance(rich_text, bool):
+
+        # bool cannot be subclassed, identity checks are equivalent to isinstance here
+        if rich_text is not True and rich_text is not False:
             raise ValueError("rich_text must be a boolean value.")
 
         self._swimlane.request(
             'post',
-            'app/{0}/record/{1}/{2}/comment'.format(
-                app_id,
-                record_id,
-                field_id
-            ),
+            'app/{0}/record/{1}/{2}/comment'.format(app_id, record_id, field_id),
             json={
                 'message': message,
                 'isRichText': rich_text,
-                'createdDate': pendulum.now().to_rfc3339_string()
+                'createdDate': rfc3339_now()
             }
         )
 
@@ -81,4 +132,4 @@ class HelperAdapter(SwimlaneResolver):
         
         validate_str(job_id, 'job_id')
 
-        return self._swimlane.request('get', "logging/job/{0}".format(job_id)).json()
+        return self._swimlane.request_json('get', "logging/job/{0}".format(job_id))
@@ -23,7 +23,7 @@ class ReportAdapter(SwimlaneResolver):
         Returns:
             :class:`list` of :class:`~swimlane.core.resources.report.Report`: List of all returned reports
         """
-        raw_reports = self._swimlane.request('get', "reports/app/{}".format(self._app.id)).json()
+        raw_reports = self._swimlane.request_json('get', "reports/app/{}".format(self._app.id))
         # Ignore StatsReports for now
         return [Report(self._app, raw_report) for raw_report in raw_reports if raw_report['$type'] == Report._type]
 
@@ -38,7 +38,7 @@ class ReportAdapter(SwimlaneResolver):
         """
         return Report(
             self._app,
-            self._swimlane.request('get', "reports/{0}".format(report_id)).json()
+            self._swimlane.request_json('get', "reports/{0}".format(report_id))
         )
 
     def build(self, name, **kwargs):
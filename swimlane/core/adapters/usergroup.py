@@ -18,7 +18,7 @@ class GroupListCursor(SwimlaneResolver, PaginatedCursor):
         return Group(self._swimlane, raw_element)
 
     def _retrieve_raw_elements(self, page):
-        response = self._swimlane.request(
+        results = self._swimlane.request_json(
             'get',
             'groups',
             params={
@@ -26,7 +26,7 @@ class GroupListCursor(SwimlaneResolver, PaginatedCursor):
                 'pageNumber': page
             }
         )
-        return response.json().get('items', [])
+        return results.get('items', [])
 
 
 class GroupAdapter(SwimlaneResolver):
@@ -94,7 +94,7 @@ class UserListCursor(SwimlaneResolver, PaginatedCursor):
         return User(self._swimlane, raw_element)
 
     def _retrieve_raw_elements(self, page):
-        response = self._swimlane.request(
+        results = self._swimlane.request_json(
             'get',
             'user',
             params={
@@ -102,7 +102,7 @@ class UserListCursor(SwimlaneResolver, PaginatedCursor):
                 'pageNumber': page
             }
         )
-        return response.json().get('items', [])
+        return results.get('items', [])
 
 
 class UserAdapter(SwimlaneResolver):
@@ -1,15 +1,16 @@
 """Core Swimlane client class"""
 
 import logging
+import threading
 
 import jwt
 import pendulum
 import requests
 from pyuri import URI
+from requests.adapters import HTTPAdapter
 from requests.compat import json
 from requests.packages import urllib3
 from requests.structures import CaseInsensitiveDict
-from six.moves.urllib.parse import urljoin
 
 from swimlane.core.adapters import GroupAdapter, UserAdapter, AppAdapter, HelperAdapter
 from swimlane.core.cache import ResourcesCache
@@ -19,6 +20,12 @@ from swimlane.exceptions import SwimlaneHTTP400Error, InvalidSwimlaneProductVers
 from swimlane.utils.version import get_package_version, compare_versions
 from swimlane.core.wrappedsession import WrappedSession
 
+try:
+    # Faster response parsing when optional orjson package is installed
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Disable insecure request warnings
 urllib3.disable_warnings()
 
@@ -82,6 +89,18 @@ class Swimlane(object):
 
     _api_root = '/api/'
 
+    # Connection pool sizing and retry policy for the HTTP adapter mounted on the session
+    # Read errors are never retried so timeouts surface as requests.Timeout after a single default_timeout, and the
+    # final 5xx response is returned instead of raised so request() still raises HTTPError for it
+    _pool_size = 32
+    _max_retries = urllib3.util.Retry(
+        total=3,
+        read=False,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False
+    )
+
     def __init__(
             self,
             host,
@@ -100,6 +119,8 @@ class Swimlane(object):
         self.host.scheme = (self.host.scheme or 'https').lower()
         self.host.path = None
 
+        self._api_base = str(self.host).rstrip('/') + self._api_root
+
         self.resources_cache = ResourcesCache(resource_cache_size)
 
         self.__settings = None
@@ -111,6 +132,20 @@ class Swimlane(object):
 
         self._session = WrappedSession()
         self._session.verify = verify_ssl
+        self._session.headers.update({
+            # Always request compressed responses over reused connections, report and search results compress well
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+
+        # Enlarge connection pools so concurrent and paginated requests reuse kept-alive connections
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_size,
+            pool_maxsize=self._pool_size,
+            max_retries=self._max_retries
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
         if username is not None and password is not None:
             self._session.auth = SwimlaneJwtAuth(
@@ -200,9 +235,6 @@ class Swimlane(object):
 
             >>> server_settings = swimlane.request('get', 'settings').json()
         """
-        while api_endpoint.startswith('/'):
-            api_endpoint = api_endpoint[1:]
-
         # Ensure a timeout is set
         kwargs.setdefault('timeout', self._default_timeout)
 
@@ -216,7 +248,7 @@ class Swimlane(object):
 
             kwargs['data'] = json.dumps(json_data, sort_keys=True, separators=(',', ':'))
 
-        response = self._session.request(method, urljoin(str(self.host) + self._api_root, api_endpoint), **kwargs)
+        response = self._session.request(method, self._api_base + api_endpoint.lstrip('/'), **kwargs)
 
         # Roll 400 errors up into SwimlaneHTTP400Errors with specific Swimlane error code support
         try:
@@ -229,11 +261,38 @@ class Swimlane(object):
 
         return response
 
+    def request_json(self, method, api_endpoint, **kwargs):
+        """Send request using :meth:`request` and return parsed JSON response content
+
+        Parses raw response bytes directly, using orjson when available. Sends `Accept: application/json` unless
+        another Accept header is provided. Not set at the session level as some endpoints, like attachment downloads,
+        return other content types
+
+        Args:
+            method (str): Request method (get, post, put, etc.)
+            api_endpoint (str): Portion of URL matching API endpoint route as listed in platform /docs help page
+            **kwargs (dict): Remaining arguments passed through to :meth:`request`
+
+        Returns:
+            Parsed JSON response content
+
+        Examples:
+
+            Request and parse server settings endpoint response
+
+            >>> server_settings = swimlane.request_json('get', 'settings')
+        """
+        headers = CaseInsensitiveDict(kwargs.get('headers', {}))
+        headers.setdefault('Accept', 'application/json')
+        kwargs['headers'] = headers
+
+        return json_loads(self.request(method, api_endpoint, **kwargs).content)
+
     @property
     def settings(self):
         """Retrieve and cache settings from server"""
         if not self.__settings:
-            self.__settings = self.request('get', 'settings').json()
+            self.__settings = self.request_json('get', 'settings')
         return self.__settings
 
     @property
@@ -308,15 +367,14 @@ class SwimlaneTokenAuth(SwimlaneResolver):
         if self.user is not None:
             return request
 
-        # Temporarily remove auth from Swimlane session for auth request to avoid recursive loop during the request
-        self._swimlane._session.auth = None
+        # Bypass session auth for authorize request to avoid recursive loop during the request
         resp = self._swimlane.request(
             'get',
             'user/authorize',
-            headers=headers
+            headers=headers,
+            auth=_no_auth
         )
-        self._swimlane._session.auth = self
-        
+
         json_content = resp.json()
         self.user = User(self._swimlane, _user_raw_from_login_content(json_content))
         
@@ -337,6 +395,7 @@ class SwimlaneJwtAuth(SwimlaneResolver):
         self.user = None
         self._login_headers = {}
         self._token_expiration = pendulum.now()
+        self._auth_lock = threading.Lock()
 
     def __call__(self, request):
         """Attach necessary headers to all requests
@@ -344,19 +403,24 @@ class SwimlaneJwtAuth(SwimlaneResolver):
         Automatically reauthenticate before sending request when nearing token expiration
         """
 
-        # Refresh token if it expires soon
-        if pendulum.now() + self._token_expiration_buffer >= self._token_expiration:
-            self.authenticate()
+        # Refresh token if it expires soon, re-checking under lock so concurrent requests only login once
+        if self._token_expiring():
+            with self._auth_lock:
+                if self._token_expiring():
+                    self.authenticate()
 
         request.headers.update(self._login_headers)
 
         return request
 
+    def _token_expiring(self):
+        """Return True if token is expired or will expire within expiration buffer"""
+        return pendulum.now() + self._token_expiration_buffer >= self._token_expiration
+
     def authenticate(self):
         """Send login request and update User instance, login headers, and token expiration"""
 
-        # Temporarily remove auth from Swimlane session for auth request to avoid recursive loop during login request
-        self._swimlane._session.auth = None
+        # Bypass session auth for login request to avoid recursive loop during login request
         resp = self._swimlane.request(
             'post',
             'user/login',
@@ -364,8 +428,8 @@ class SwimlaneJwtAuth(SwimlaneResolver):
                 'userName': self._username,
                 'password': self._password
             },
+            auth=_no_auth
         )
-        self._swimlane._session.auth = self
 
         # Get JWT from response content
         json_content = resp.json()
@@ -387,6 +451,14 @@ class SwimlaneJwtAuth(SwimlaneResolver):
         self._token_expiration = token_expiration
 
 
+def _no_auth(request):
+    """Pass-through auth handler overriding session auth for authentication requests
+
+    Avoids temporarily unsetting session auth, which would leave concurrent requests unauthenticated
+    """
+    return request
+
+
 def _user_raw_from_login_content(login_content):
     """Returns a User instance with appropriate raw data parsed from login response content"""
     matching_keys = [
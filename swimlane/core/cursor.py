@@ -25,43 +25,67 @@ class Cursor(object):
 
 
 class PaginatedCursor(Cursor):
-    """Handle paginated lists, exposes hooks to simplify retrieval and parsing of paginated data"""
+    """Handle paginated lists, exposes hooks to simplify retrieval and parsing of paginated data
+
+    Retrieved elements are cached and returned on subsequent iterations unless cache is disabled, in which case each
+    iteration retrieves elements again and only the current pages are held in memory
+    """
 
     default_limit = 0
     default_page_size = 10
 
-    def __init__(self, limit=default_limit, page_size=default_page_size):
+    def __init__(self, limit=default_limit, page_size=default_page_size, cache=True):
         super(PaginatedCursor, self).__init__()
 
         self.__limit = limit
         self.page_size = page_size
+        self._cache = cache
 
         if self.__limit:
             self.page_size = min(self.page_size, self.__limit)
 
+    def __len__(self):
+        # Counting without a cache would retrieve every page an extra time, raising TypeError also lets list() skip its
+        # length hint and only iterate once
+        if not self._cache:
+            raise TypeError('len() is not supported on {} with cache disabled'.format(self.__class__.__name__))
+        return super(PaginatedCursor, self).__len__()
+
+    @property
+    def limit(self):
+        """Max number of elements to retrieve, falsy for no limit"""
+        return self.__limit
+
     def _evaluate(self):
         """Lazily retrieve and paginate report results and build Record instances from returned data"""
         if self._elements:
             for element in self._elements:
                 yield element
         else:
-            for page in itertools.count():
-                raw_elements = self._retrieve_raw_elements(page)
-
+            count = 0
+            for raw_elements in self._iter_raw_pages():
                 for raw_element in raw_elements:
                     element = self._parse_raw_element(raw_element)
-                    self._elements.append(element)
+                    if self._cache:
+                        self._elements.append(element)
+                    count += 1
                     yield element
-                    if self.__limit and len(self._elements) >= self.__limit:
+                    if self.__limit and count >= self.__limit:
                         break
 
-                if any([
-                    (len(raw_elements) < self.page_size),
-                    (self.__limit and len(self._elements) >= self.__limit),
-                    (self.page_size == 0)
-                ]):
+                if self.__limit and count >= self.__limit:
                     break
 
+    def _iter_raw_pages(self):
+        """Yield raw elements of each page in order, stopping after the first short page"""
+        for page in itertools.count():
+            raw_elements = self._retrieve_raw_elements(page)
+
+            yield raw_elements
+
+            if len(raw_elements) < self.page_size or self.page_size == 0:
+                break
+
     def _retrieve_raw_elements(self, page):
         """Send request and return response for single page of data"""
         raise NotImplementedError
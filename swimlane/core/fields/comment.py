@@ -1,6 +1,5 @@
-import pendulum
-
 from swimlane.core.resources.comment import Comment
+from swimlane.utils import rfc3339_now
 from .base import CursorField, FieldCursor, ReadOnly
 
 
@@ -16,7 +15,7 @@ class CommentCursor(FieldCursor):
         sw_repr = {
             '$type': 'Core.Models.Record.Comments, Core',
             'createdByUser': self._record._swimlane.user.as_usergroup_selection(),
-            'createdDate': pendulum.now().to_rfc3339_string(),
+            'createdDate': rfc3339_now(),
             'message': message,
             'isRichText': rich_text
         }
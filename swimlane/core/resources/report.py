@@ -1,11 +1,14 @@
-import pendulum
+import collections
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
 
 from swimlane.core.cursor import PaginatedCursor
 from swimlane.core.fields.list import ListField
 from swimlane.core.resources.base import APIResource
 from swimlane.core.resources.record import Record, record_factory
 from swimlane.core.search import CONTAINS, EQ, EXCLUDES, NOT_EQ, LT, GT, LTE, GTE, ASC, DESC
-from swimlane.utils import validate_type
+from swimlane.utils import rfc3339_now, validate_type
 
 
 class Report(APIResource, PaginatedCursor):
@@ -15,7 +18,9 @@ class Report(APIResource, PaginatedCursor):
 
     Notes:
         Record retrieval is lazily evaluated and cached internally, adding a filter and attempting to iterate again will
-        not respect the additional filter and will return the same set of records each time
+        not respect the additional filter and will return the same set of records each time. Pass `cache=False` to
+        stream records instead, retrieving results again on each iteration without holding all records in memory.
+        Uncached reports do not support `len()`
 
     Examples:
 
@@ -46,10 +51,15 @@ class Report(APIResource, PaginatedCursor):
         limit (int): Max number of records to return from report/search
         page_size (int): Max number of records per page
         keywords (list(str)): List of keywords to use in report/search
+        cache (bool): Cache retrieved records for subsequent iterations. Defaults to True
     """
 
     _type = "Core.Models.Search.Report, Core"
 
+    _sorts_type = "System.Collections.Generic.Dictionary`2" \
+                  "[[System.String, mscorlib]," \
+                  "[Core.Models.Search.SortTypes, Core]], mscorlib"
+
     _FILTER_OPERANDS = (
         EQ,
         NOT_EQ,
@@ -68,32 +78,101 @@ class Report(APIResource, PaginatedCursor):
 
     default_limit = 50
 
+    # Max number of result pages retrieved concurrently after the first page
+    max_page_workers = 8
+
     def __init__(self, app, raw, **kwargs):
         APIResource.__init__(self, app._swimlane, raw)
         PaginatedCursor.__init__(self,
                                  limit=kwargs.pop('limit', self.default_limit),
-                                 page_size=kwargs.pop('page_size', self.default_page_size))
+                                 page_size=kwargs.pop('page_size', self.default_page_size),
+                                 cache=kwargs.pop('cache', True))
 
         self.name = self._raw['name']
         self.keywords = kwargs.pop('keywords', [])
 
         self._app = app
+        self.__record_stub = None
 
-        for field_id in self._app._fields_by_id.keys():
-            self._raw['columns'].append(field_id)
+        self._raw['columns'].extend(self._app._fields_by_id)
 
     def __str__(self):
         return self.name
 
-    def _retrieve_raw_elements(self, page):
+    def _iter_raw_pages(self):
+        """Retrieve first page to determine total record count, then retrieve remaining pages concurrently
+
+        At most twice the number of workers pages are requested ahead of the page currently being consumed
+        """
+        # Static portion of search body is serialized once per iteration, only the page offset changes between pages
+        body_prefix = self._get_search_body_prefix()
+
+        search_results = self._retrieve_search_results(0, body_prefix)
+        yield search_results['results'].get(self._app.id, [])
+
+        total = search_results.get('count', 0)
+        if self.limit:
+            total = min(total, self.limit)
+
+        if not self.page_size:
+            return
+
+        # Integer ceiling division, exact for any record count
+        num_pages = -(-total // self.page_size)
+        if num_pages <= 1:
+            return
+
+        pages = iter(range(1, num_pages))
+        pending = collections.deque()
+        executor = ThreadPoolExecutor(max_workers=min(self.max_page_workers, num_pages - 1))
+        try:
+            for page in itertools.islice(pages, self.max_page_workers * 2):
+                pending.append(executor.submit(self._retrieve_raw_elements, page, body_prefix))
+
+            while pending:
+                raw_elements = pending.popleft().result()
+
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(executor.submit(self._retrieve_raw_elements, next_page, body_prefix))
+
+                yield raw_elements
+        finally:
+            # Drop any prefetched pages not yet started when iteration stops early
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
+
+    def _retrieve_raw_elements(self, page, body_prefix=None):
+        return self._retrieve_search_results(page, body_prefix)['results'].get(self._app.id, [])
+
+    def _retrieve_search_results(self, page, body_prefix=None):
+        """Send search request for single page of report results and return full response data
+
+        Args:
+            page (int): Page offset
+            body_prefix (str): Serialized search body from :meth:`_get_search_body_prefix`. Built from current report
+                state if not provided
+        """
+        body_prefix = body_prefix or self._get_search_body_prefix()
+
+        return self._swimlane.request_json(
+            'post',
+            'search',
+            data='{0},"offset":{1}}}'.format(body_prefix, page),
+            headers={'Content-Type': 'application/json'}
+        )
+
+    def _get_search_body_prefix(self):
+        """Return serialized search body for current report state, excluding page offset and closing brace"""
         body = self._raw.copy()
 
+        body.pop('offset', None)
         body['pageSize'] = self.page_size
-        body['offset'] = page
         body['keywords'] = ', '.join(self.keywords)
 
-        response = self._swimlane.request('post', 'search', json=body)
-        return response.json()['results'].get(self._app.id, [])
+        # Serialized the same as Swimlane.request json bodies
+        return json.dumps(body, sort_keys=True, separators=(',', ':'))[:-1]
 
     def _parse_raw_element(self, raw_element):
         return Record(self._app, raw_element)
@@ -161,9 +240,17 @@ class Report(APIResource, PaginatedCursor):
         if not field_name or not isinstance(field_name, str):
             raise ValueError('field_name is of an invalid format, expected non-empty string')
 
-        # Use temp Record instance for target app to translate values into expected API format
-        record_stub = record_factory(self._app)
-        return record_stub.get_field(field_name)
+        return self._record_stub.get_field(field_name)
+
+    @property
+    def _record_stub(self):
+        """Temp Record instance for target app used to translate values into expected API format
+
+        Built once on first use and reused for all filters, sorts, and columns added to report
+        """
+        if self.__record_stub is None:
+            self.__record_stub = record_factory(self._app)
+        return self.__record_stub
 
     def parse_field_value(self, field, value):
         if isinstance(field, ListField):
@@ -198,7 +285,7 @@ def report_factory(app, report_name, **kwargs):
         **kwargs: Kwargs to pass to the Report class
     """
     # pylint: disable=protected-access
-    created = pendulum.now().to_rfc3339_string()
+    created = rfc3339_now()
     user_model = app._swimlane.user.as_usergroup_selection()
 
     return Report(
@@ -210,9 +297,7 @@ def report_factory(app, report_name, **kwargs):
             "applicationIds": [app.id],
             "columns": [],
             "sorts": {
-                "$type": "System.Collections.Generic.Dictionary`2"
-                         "[[System.String, mscorlib],"
-                         "[Core.Models.Search.SortTypes, Core]], mscorlib",
+                "$type": Report._sorts_type,
             },
             "filters": [],
             "defaultSearchReport": False,
@@ -1,6 +1,7 @@
 """Utility functions"""
 from __future__ import absolute_import
 
+import datetime
 import importlib
 import pkgutil
 import random
@@ -21,6 +22,18 @@ def random_string(length, source=string.ascii_letters + string.digits):
     return ''.join(random.choice(source) for _ in range(length))
 
 
+def rfc3339_now():
+    """Return current UTC time as RFC 3339 string
+
+    Equivalent to `pendulum.now().to_rfc3339_string()` normalized to UTC, without pendulum's timezone lookup and
+    object construction overhead
+
+    Returns:
+        str: Current time formatted as RFC 3339 string, e.g. 2017-04-05T13:00:00.123456+00:00
+    """
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
 def get_recursive_subclasses(cls):
     """Return list of all subclasses for a class, including subclasses of direct subclasses"""
     return cls.__subclasses__() + [g for s in cls.__subclasses__() for g in get_recursive_subclasses(s)]
@@ -5,6 +5,14 @@ from pkg_resources import get_distribution, DistributionNotFound
 
 from swimlane.exceptions import InvalidSwimlaneBuildVersion
 
+_VERSION_SECTION_RE = re.compile(r'\d+')
+
+
+@functools.lru_cache(maxsize=128)
+def _version_sections(version):
+    """Return tuple of integer sections parsed from version string, cached per distinct version"""
+    return tuple(int(match) for match in _VERSION_SECTION_RE.findall(version))
+
 
 def compare_versions(version_a, version_b, zerofill=False):
     """Return direction of version relative to provided version sections
@@ -38,8 +46,8 @@ def compare_versions(version_a, version_b, zerofill=False):
         >>> compare_versions('2.13.2-1234', '2.13.2', True) == -1
         >>> compare_versions('2.13.2', '2.13.2', True) == 0
     """
-    a_sections = list((int(match) for match in re.findall(r'\d+', version_a)))
-    b_sections = list((int(match) for match in re.findall(r'\d+', version_b)))
+    a_sections = list(_version_sections(version_a))
+    b_sections = list(_version_sections(version_b))
 
     if zerofill:
         max_sections = max([len(a_sections), len(b_sections)])
@@ -1,4 +1,5 @@
 import mock
+import pytest
 
 app_id = '123'
 record_id = '456'
@@ -35,6 +36,40 @@ def test_add_references(mock_swimlane):
         )
 
 
+def test_add_references_bulk(mock_swimlane):
+    """Test bulk add-references sends one request per record after validating all references"""
+    references = [
+        {
+            'record_id': 'record{}'.format(i),
+            'field_id': field_id,
+            'target_record_ids': ['target{}'.format(i)]
+        }
+        for i in range(5)
+    ]
+
+    with mock.patch.object(mock_swimlane, 'request') as mock_request:
+        mock_swimlane.helpers.add_record_references_bulk(app_id, references)
+
+        assert mock_request.call_count == 5
+        for reference in references:
+            mock_request.assert_any_call(
+                'post',
+                'app/{}/record/{}/add-references'.format(app_id, reference['record_id']),
+                json={
+                    'fieldId': field_id,
+                    'targetRecordIds': reference['target_record_ids']
+                }
+            )
+
+    invalid_references = references + [{'record_id': record_id, 'field_id': field_id, 'target_record_ids': []}]
+
+    with mock.patch.object(mock_swimlane, 'request') as mock_request:
+        with pytest.raises(ValueError):
+            mock_swimlane.helpers.add_record_references_bulk(app_id, invalid_references)
+
+        assert mock_request.call_count == 0
+
+
 def test_add_comment(mock_swimlane):
     with mock.patch.object(mock_swimlane, 'request') as mock_request:
         mock_swimlane.helpers.add_comment(
@@ -46,9 +81,26 @@ def test_add_comment(mock_swimlane):
 
         assert mock_request.call_count == 1
 
+        mock_request.assert_called_once_with(
+            'post',
+            'app/{}/record/{}/{}/comment'.format(app_id, record_id, field_id),
+            json={
+                'message': 'message',
+                'isRichText': False,
+                'createdDate': mock.ANY
+            }
+        )
+
+        for rich_text in (1, 0, 'true', None):
+            with pytest.raises(ValueError):
+                mock_swimlane.helpers.add_comment(app_id, record_id, field_id, 'message', rich_text)
+
+        assert mock_request.call_count == 1
+
+
 def test_check_bulk_job_status(mock_swimlane):
 
     job_id = 'as03235as'
-    with mock.patch.object(mock_swimlane, 'request') as mock_request:
+    with mock.patch.object(mock_swimlane, 'request_json') as mock_request:
         mock_swimlane.helpers.check_bulk_job_status(job_id)
     mock_request.assert_called_once_with('get', 'logging/job/{0}'.format(job_id))
\ No newline at end of file
@@ -1,3 +1,4 @@
+import json
 import numbers
 
 import mock
@@ -104,8 +105,7 @@ def test_search(mock_swimlane, mock_app, mock_record):
         # Access property to ensure call
         user = mock_swimlane.user
 
-    mock_response = mock.MagicMock()
-    mock_response.json.return_value = {
+    search_results = {
         '$type': 'API.Models.Search.GroupedSearchResults, API',
         'count': 1,
         'limit': 50,
@@ -114,13 +114,13 @@ def test_search(mock_swimlane, mock_app, mock_record):
             '$type': 'System.Collections.Generic.Dictionary`2[[System.String, mscorlib],[Core.Models.Record.Record[], Core]], mscorlib',
             '58e4bb4407637a0e4c4f9873': [mock_record._raw]}}
 
-    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response) as mock_func:
+    with mock.patch.object(mock_swimlane, 'request_json', return_value=search_results) as mock_func:
         with mock.patch('swimlane.core.adapters.report.Report._parse_raw_element', return_value=mock_record):
             assert mock_app.records.search(('Tracking Id', 'equals', 'RA-7'), limit=0, page_size=1234) == [mock_record]
 
-    mock_func.assert_called_once_with('post', 'search', json=mock.ANY)
+    mock_func.assert_called_once_with('post', 'search', data=mock.ANY, headers={'Content-Type': 'application/json'})
     call_args, call_kwargs = mock_func.call_args
-    parameter = call_kwargs['json']
+    parameter = json.loads(call_kwargs['data'])
     assert 'pageSize' in parameter
     assert parameter['pageSize'] == 1234
 
@@ -180,8 +180,7 @@ def test_filters_type_check(mock_swimlane, mock_app, mock_record):
         # Access property to ensure call
         user = mock_swimlane.user
 
-    mock_response = mock.MagicMock()
-    mock_response.json.return_value = {
+    search_results = {
         '$type': 'API.Models.Search.GroupedSearchResults, API',
         'count': 1,
         'limit': 50,
@@ -190,7 +189,7 @@ def test_filters_type_check(mock_swimlane, mock_app, mock_record):
             '$type': 'System.Collections.Generic.Dictionary`2[[System.String, mscorlib],[Core.Models.Record.Record[], Core]], mscorlib',
             '58e4bb4407637a0e4c4f9873': [mock_record._raw]}}
 
-    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response) as mock_func:
+    with mock.patch.object(mock_swimlane, 'request_json', return_value=search_results) as mock_func:
         with mock.patch('swimlane.core.adapters.report.Report._parse_raw_element', return_value=mock_record):
             with pytest.raises(ValueError):
                 assert mock_app.records.search(('Numeric', 'equals', '7'))
@@ -30,10 +30,7 @@ raw_report = {'$type': 'Core.Models.Search.Report, Core',
 
 
 def test_list(mock_app, mock_swimlane):
-    mock_response = mock.MagicMock()
-    mock_response.json.return_value = [raw_report for _ in range(3)]
-
-    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response):
+    with mock.patch.object(mock_swimlane, 'request_json', return_value=[raw_report for _ in range(3)]):
         reports = mock_app.reports.list()
         assert len(reports) == 3
         for report in reports:
@@ -41,9 +38,6 @@ def test_list(mock_app, mock_swimlane):
 
 
 def test_get(mock_app, mock_swimlane):
-    mock_response = mock.MagicMock()
-    mock_response.json.return_value = raw_report
-
-    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response):
+    with mock.patch.object(mock_swimlane, 'request_json', return_value=raw_report):
         report = mock_app.reports.get(report_id='report_id')
         assert isinstance(report, Report)
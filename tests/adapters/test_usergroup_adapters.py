@@ -5,10 +5,7 @@ from swimlane.core.resources.usergroup import Group, User
 
 
 def test_group_list(mock_group, mock_swimlane):
-    mock_response = mock.MagicMock()
-    mock_response.json.return_value = {'items': [mock_group._raw for _ in range(3)]}
-
-    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response):
+    with mock.patch.object(mock_swimlane, 'request_json', return_value={'items': [mock_group._raw for _ in range(3)]}):
         groups = mock_swimlane.groups.list()
         assert len(groups) == 3
         for group in groups:
@@ -45,10 +42,7 @@ def test_group_get_invalid_args(mock_swimlane, kwargs):
 
 
 def test_user_list(mock_user, mock_swimlane):
-    mock_response = mock.MagicMock()
-    mock_response.json.return_value = {'items': [mock_user._raw for _ in range(3)]}
-
-    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response):
+    with mock.patch.object(mock_swimlane, 'request_json', return_value={'items': [mock_user._raw for _ in range(3)]}):
         users = mock_swimlane.users.list()
         assert len(users) == 3
         for user in users:
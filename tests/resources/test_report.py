@@ -1,6 +1,9 @@
+import json
+
 import mock
 import pytest
 
+from swimlane.core.resources.record import record_factory
 from swimlane.core.resources.report import report_factory
 from swimlane.exceptions import UnknownField
 
@@ -35,13 +38,10 @@ class TestReport(object):
             assert mock_request.call_count == 0
 
     def test_limit(self, mock_record, mock_app, mock_swimlane):
-        with mock.patch.object(mock_swimlane, 'request') as mock_request:
-            mock_response = mock.MagicMock()
-            mock_request.return_value = mock_response
-
-            mock_response.json.return_value = {
+        with mock.patch.object(mock_swimlane, 'request_json') as mock_request:
+            mock_request.return_value = {
                 '$type': 'API.Models.Search.GroupedSearchResults, API',
-                'count': 2,
+                'count': 100,
                 'limit': 50,
                 'offset': 0,
                 'results': {
@@ -60,11 +60,8 @@ class TestReport(object):
 
     def test_iteration(self, mock_report, mock_record, mock_swimlane):
         """Test iterating over report results"""
-        with mock.patch.object(mock_swimlane, 'request') as mock_request:
-            mock_response = mock.MagicMock()
-            mock_request.return_value = mock_response
-
-            mock_response.json.return_value = {
+        with mock.patch.object(mock_swimlane, 'request_json') as mock_request:
+            mock_request.return_value = {
                 '$type': 'API.Models.Search.GroupedSearchResults, API',
                 'count': 1,
                 'limit': 50,
@@ -88,4 +85,85 @@ class TestReport(object):
                 assert len(results) == 1
                 assert mock_request.call_count == 1
 
-
+    def test_concurrent_pagination(self, mock_app, mock_swimlane):
+        """Test remaining pages are requested after first page reports total count and yielded in page order"""
+        def search(method, endpoint, data, headers):
+            offset = json.loads(data)['offset']
+            return {
+                'count': 25,
+                'results': {
+                    mock_app.id: [offset * 10 + i for i in range(min(10, 25 - offset * 10))]
+                }
+            }
+
+        with mock.patch.object(mock_swimlane, 'request_json', side_effect=search) as mock_request:
+            with mock.patch('swimlane.core.resources.report.Report._parse_raw_element', side_effect=lambda raw: raw):
+                report = report_factory(mock_app, 'paginated', limit=0)
+
+                assert list(report) == list(range(25))
+                assert mock_request.call_count == 3
+                assert sorted(json.loads(call[1]['data'])['offset'] for call in mock_request.call_args_list) == [0, 1, 2]
+
+    def test_pagination_page_boundary(self, mock_app, mock_swimlane):
+        """Test no extra page is requested when total count falls exactly on a page boundary"""
+        with mock.patch.object(mock_swimlane, 'request_json') as mock_request:
+            mock_request.return_value = {
+                'count': 20,
+                'results': {mock_app.id: list(range(10))}
+            }
+
+            with mock.patch('swimlane.core.resources.report.Report._parse_raw_element', side_effect=lambda raw: raw):
+                report = report_factory(mock_app, 'boundary', limit=0)
+
+                assert len(list(report)) == 20
+                assert mock_request.call_count == 2
+
+    def test_iteration_without_cache(self, mock_app, mock_swimlane):
+        """Test disabling cache streams records without retaining them, requesting each page once per iteration"""
+        def search(method, endpoint, data, headers):
+            offset = json.loads(data)['offset']
+            return {
+                'count': 25,
+                'results': {
+                    mock_app.id: [offset * 10 + i for i in range(min(10, 25 - offset * 10))]
+                }
+            }
+
+        with mock.patch.object(mock_swimlane, 'request_json', side_effect=search) as mock_request:
+            with mock.patch('swimlane.core.resources.report.Report._parse_raw_element', side_effect=lambda raw: raw):
+                report = report_factory(mock_app, 'streaming', limit=0, cache=False)
+
+                assert list(report) == list(range(25))
+                assert report._elements == []
+                assert mock_request.call_count == 3
+
+                assert list(report) == list(range(25))
+                assert mock_request.call_count == 6
+
+                with pytest.raises(TypeError):
+                    len(report)
+                assert mock_request.call_count == 6
+
+    def test_search_body(self, mock_report, mock_swimlane):
+        """Test search body is serialized once and sent as valid JSON with the requested page offset"""
+        mock_report._raw['offset'] = 5
+        mock_report.keywords = ['a', 'b']
+
+        with mock.patch.object(mock_swimlane, 'request_json') as mock_request:
+            mock_report._retrieve_search_results(3)
+
+            body = json.loads(mock_request.call_args[1]['data'])
+            assert body['offset'] == 3
+            assert body['pageSize'] == mock_report.page_size
+            assert body['keywords'] == 'a, b'
+            assert body['name'] == mock_report.name
+
+    def test_record_stub_reused(self, mock_report):
+        """Test stub record used to resolve fields is only built once per report"""
+        with mock.patch('swimlane.core.resources.report.record_factory', wraps=record_factory) as mock_factory:
+            mock_report.filter('Tracking Id', 'equals', 'RA-7')
+            mock_report.filter('Tracking Id', 'doesNotEqual', 'RA-8')
+            mock_report.sort('Tracking Id', 'ascending')
+            mock_report.set_columns('Tracking Id')
+
+            assert mock_factory.call_count == 1
@@ -1,9 +1,18 @@
 """Tests for custom Swimlane errors"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import mock
+import pendulum
 import pytest
-from requests import HTTPError
+from requests import HTTPError, Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RetryError
+from urllib3.util import Retry
 
-from swimlane.core.client import SwimlaneJwtAuth, SwimlaneTokenAuth, Swimlane
+from swimlane.core.client import SwimlaneJwtAuth, SwimlaneTokenAuth, Swimlane, _no_auth, json_loads
 from swimlane.exceptions import SwimlaneHTTP400Error, InvalidSwimlaneProductVersion
 
 def test_api_credential_handling(mock_swimlane):
@@ -123,6 +132,21 @@ def test_request_handling(mock_swimlane):
             raise RuntimeError
 
 
+@pytest.mark.parametrize('loads', [json_loads, json.loads], ids=['default', 'stdlib'])
+def test_request_json(mock_swimlane, loads):
+    """Test request_json parses raw response content with both the optional orjson and the stdlib json parser"""
+    with mock.patch('swimlane.core.client.json_loads', loads), \
+            mock.patch.object(mock_swimlane, '_session') as mock_session:
+        mock_session.request.return_value.content = b'{"id": "abc", "values": [1, 2]}'
+
+        assert mock_swimlane.request_json('get', 'somepage') == {'id': 'abc', 'values': [1, 2]}
+        assert mock_session.request.call_args[1]['headers']['Accept'] == 'application/json'
+
+        # Explicit Accept header is preserved
+        mock_swimlane.request_json('get', 'somepage', headers={'accept': 'text/plain'})
+        assert mock_session.request.call_args[1]['headers']['Accept'] == 'text/plain'
+
+
 def test_lazy_settings():
     """Test accessing settings is evaluated lazily and cached after first retrieval"""
     with mock.patch.object(Swimlane, 'request') as mock_request:
@@ -134,7 +158,7 @@ def test_lazy_settings():
             data = {
                 'apiVersion': '2.15.0-1234'
             }
-            mock_response.json.return_value = data
+            mock_response.content = json.dumps(data).encode('utf-8')
 
             mock_swimlane = Swimlane('http://host', 'user', 'pass', verify_server_version=False)
 
@@ -213,6 +237,36 @@ def test_auth(mock_swimlane):
         assert auth._login_headers == {'Authorization': 'Bearer {}'.format(JWT_TOKEN)}
         mock_inflight_request.headers.update.assert_called_once_with(auth._login_headers)
 
+        # Login request bypasses session auth without unsetting it for other requests
+        assert mock_request.call_args[1]['auth'] is _no_auth
+
+
+def test_auth_reauthenticates_once(mock_swimlane):
+    """Test concurrent requests with an expired token only send a single login request"""
+    auth = SwimlaneJwtAuth(mock_swimlane, 'admin', 'password')
+    auth._token_expiration = pendulum.now()
+
+    thread_count = 8
+    barrier = threading.Barrier(thread_count)
+
+    def fake_authenticate():
+        # Hold the refresh open long enough for every other thread to see the expired token
+        time.sleep(0.2)
+        auth._token_expiration = pendulum.now().add(hours=1)
+
+    def send_request():
+        barrier.wait()
+        auth(mock.MagicMock())
+
+    with mock.patch.object(auth, 'authenticate', side_effect=fake_authenticate) as mock_authenticate:
+        threads = [threading.Thread(target=send_request) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_authenticate.call_count == 1
+
 
 def test_repr(mock_swimlane):
     assert repr(mock_swimlane) == '<Swimlane: admin @ http://host v3.0+5.0.0+123456>'
@@ -273,3 +327,101 @@ def test_host_url_scheme_coercion():
             mock_swimlane = Swimlane('HTTP://host', 'user', 'pass', verify_server_version=False)
             assert mock_swimlane.host.scheme == 'http'
 
+
+def test_session_connection_pooling():
+    """Test session mounts a pooled HTTP adapter with retries for both URL schemes"""
+    with mock.patch.object(SwimlaneJwtAuth, 'authenticate', return_value=(None, {})):
+        sw = Swimlane('https://host', 'user', 'pass', verify_server_version=False)
+
+        for url in ('https://host/api/', 'http://host/api/'):
+            adapter = sw._session.get_adapter(url)
+            assert isinstance(adapter, HTTPAdapter)
+            assert adapter._pool_connections == Swimlane._pool_size
+            assert adapter._pool_maxsize == Swimlane._pool_size
+            assert adapter.max_retries.total == 3
+
+
+@pytest.fixture
+def local_server():
+    """Local HTTP server counting requests, responding to /api/status/<code> and /api/slow"""
+    requests_received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_received.append(self.path)
+
+            if self.path == '/api/slow':
+                time.sleep(0.5)
+                status = 200
+            else:
+                status = int(self.path.rsplit('/', 1)[-1])
+
+            self.send_response(status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    with mock.patch.object(SwimlaneJwtAuth, '__call__', lambda self, request: request):
+        sw = Swimlane(
+            'http://127.0.0.1:{}'.format(server.server_address[1]),
+            'user',
+            'pass',
+            verify_server_version=False
+        )
+        yield sw, requests_received
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries_exhausted_raise_http_error(local_server):
+    """Test retried 5xx responses still raise HTTPError once retries are exhausted"""
+    sw, requests_received = local_server
+
+    with mock.patch.object(Retry, 'sleep'):
+        with pytest.raises(HTTPError) as exc_info:
+            sw.request('get', 'status/503')
+
+    assert not isinstance(exc_info.value, RetryError)
+    assert exc_info.value.response.status_code == 503
+    assert len(requests_received) == 4
+
+
+def test_read_timeout_not_retried(local_server):
+    """Test read timeouts are raised as requests.Timeout without being retried"""
+    sw, requests_received = local_server
+
+    with pytest.raises(Timeout):
+        sw.request('get', 'slow', timeout=0.1)
+
+    assert len(requests_received) == 1
+
+
+def test_session_default_headers():
+    """Test session always requests compressed responses"""
+    with mock.patch.object(SwimlaneJwtAuth, 'authenticate', return_value=(None, {})):
+        sw = Swimlane('https://host', 'user', 'pass', verify_server_version=False)
+
+        assert sw._session.headers['Accept-Encoding'] == 'gzip, deflate'
+        assert sw._session.headers['Connection'] == 'keep-alive'
+
+
+def test_request_url(mock_swimlane):
+    """Test API endpoint is joined to host and API root regardless of leading slashes"""
+    with mock.patch.object(mock_swimlane, '_session') as mock_session:
+        for endpoint in ('app/123', '/app/123', '///app/123'):
+            mock_swimlane.request('get', endpoint)
+            assert mock_session.request.call_args[0] == ('get', 'http://host/api/app/123')
+
+
+def test_api_base_ignores_host_path():
+    """Test API base URL is built once from host, dropping any provided path"""
+    with mock.patch.object(SwimlaneJwtAuth, 'authenticate', return_value=(None, {})):
+        sw = Swimlane('https://host:8443/some/path/', 'user', 'pass', verify_server_version=False)
+        assert sw._api_base == 'https://host:8443/api/'
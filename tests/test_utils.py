@@ -3,6 +3,7 @@ import string
 import sys
 
 import mock
+import pendulum
 import pytest
 from pkg_resources import DistributionNotFound
 
@@ -12,12 +13,14 @@ from swimlane.utils import (
     random_string,
     get_recursive_subclasses,
     import_submodules,
-    one_of_keyword_only
+    one_of_keyword_only,
+    rfc3339_now
 )
 from swimlane.utils.version import (
     compare_versions,
     requires_swimlane_version,
-    get_package_version
+    get_package_version,
+    _version_sections
 )
 
 
@@ -31,6 +34,16 @@ def test_random_string():
     assert set(generated_string).issubset(set(string.ascii_uppercase))
 
 
+def test_rfc3339_now():
+    """Test current time is returned as UTC RFC 3339 string parseable by pendulum"""
+    before = pendulum.now()
+    now = rfc3339_now()
+    after = pendulum.now()
+
+    assert now.endswith('+00:00')
+    assert before <= pendulum.parse(now) <= after
+
+
 def test_get_recursive_subclasses():
     class Base(object):
         pass
@@ -97,6 +110,18 @@ def test_compare_versions_with_zerofill(inputs, expected):
     assert compare_versions(target, inputs, True) == -expected
 
 
+def test_version_sections_cached():
+    """Test version strings are parsed into integer sections once and reused on subsequent comparisons"""
+    _version_sections.cache_clear()
+
+    assert _version_sections('2.13.2-173414') == (2, 13, 2, 173414)
+    compare_versions('2.13.2-173414', '2.13', True)
+
+    info = _version_sections.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+
+
 def test_get_package_version():
     mock_dist = mock.MagicMock()
     mock_dist.version = '1.2.3'